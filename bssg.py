@@ -1,14 +1,29 @@
 import argparse
 import datetime
+import itertools
+import operator
 import os
 import shutil
-import re
+import string
 import mistune
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import pathlib
 
 
 MAX_URL_LEN = 18  # max length of a tag or post file (not counting .html)
+TITLE_PLACEHOLDER = "<title>template</title>"
+BODY_PLACEHOLDER = "<!--main page-->\n    <!--/main page-->"
+PATH_PLACEHOLDER = "<!--main_path-->"
+# output buffer size; large enough that a streamed page reaches disk in one write
+WRITE_BUFFER_SIZE = 256 * 1024
+# shared parser; mistune.markdown() would build a new one for every post
+MARKDOWN = mistune.Markdown(escape=True)
+URL_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + "-_.+!*'()")
+# maps spaces to dashes and drops every other unsafe ASCII character. Only
+# ASCII needs covering: no URL-safe characters fall outside of it, so
+# remove_unsafe_chars() discards non-ASCII text before translating.
+URL_TRANSLATION = {i: None for i in range(128) if chr(i) not in URL_SAFE_CHARS}
+URL_TRANSLATION[ord(' ')] = '-'
 
 
 class Tag:
@@ -21,10 +36,12 @@ class Tag:
         members (List): contains Post objects tagged w/ this tag
     """
 
-    def __init__(self, name, members=[]):
+    __slots__ = ("name", "members")
+
+    def __init__(self, name, members=None):
         """Default constructor builds tag with given name and empty members"""
         self.name = remove_unsafe_chars(name)
-        self.members = members
+        self.members = [] if members is None else members
 
 
 class Post:
@@ -32,19 +49,93 @@ class Post:
 
     Attributes:
         title (String): post title
+        url (String): URL-safe name of the post's page (not counting .html)
         tags (List): list of Tag objects associated with the post
         date (datetime.datetime): date post published
+        month_name (String): full name of the month the post was published
+        year_str (String): year the post was published
+        date_display (String): publish date as shown on post cards
         preview (String): Preview text to display in post card
         body (String): HTML containing blog post substance
+        card_html (String): HTML for the post's card in index pages, cached
+            by make_card() the first time it is rendered; None until then
     """
 
-    def __init__(self, title, date, tags=[], preview="",
-                 body=""):
+    __slots__ = ("title", "url", "tags", "date", "month_name", "year_str",
+                 "date_display", "preview", "body", "card_html")
+
+    def __init__(self, title, date, tags=None, preview="",
+                 body="", url=""):
         self.title = title
-        self.tags = tags
+        self.url = url
+        self.tags = [] if tags is None else tags
         self.date = date
+        # formatted once here since pages, cards and grouping all need them
+        self.month_name = date.strftime("%B")
+        self.year_str = str(date.year)
+        self.date_display = date.strftime("%B %d %Y")
         self.preview = preview
         self.body = body
+        self.card_html = None
+
+
+class PageTemplate:
+    """Page template split up front around its title and body placeholders
+
+    Pages are streamed to their output file piece by piece, interleaving the
+    fixed template pieces with the page-specific values, rather than copying
+    the template and rescanning it once per placeholder for every page.
+
+    Attributes:
+        pieces (List): template text split on the title placeholder, with
+            each part further split on the body placeholder
+        filled_pieces (Dictionary): key is a main_path, value is a copy of
+            pieces with that path already substituted in
+    """
+
+    def __init__(self, template_html):
+        self.pieces = [part.split(BODY_PLACEHOLDER)
+                       for part in template_html.split(TITLE_PLACEHOLDER)]
+        self.filled_pieces = {}
+
+    def fill_path(self, main_path):
+        """Get the template pieces with main_path placeholders filled in
+
+        Pages at the same depth share a main_path, so the substitution only
+        runs once per depth rather than once per page.
+
+        Args:
+            main_path (String): relative path from the page to the site root
+
+        Returns:
+            pieces, laid out like the pieces attribute
+        """
+        filled = self.filled_pieces.get(main_path)
+        if filled is None:
+            filled = [[piece.replace(PATH_PLACEHOLDER, main_path)
+                       for piece in part] for part in self.pieces]
+            self.filled_pieces[main_path] = filled
+        return filled
+
+    def write(self, out_file, title, body, main_path):
+        """Fill in the template and write the page out
+
+        Args:
+            out_file (File): open text file to write the page to
+            title (String): page title
+            body (String): HTML for the main page content
+            main_path (String): relative path from the page to the site root,
+                substituted for every main_path placeholder on the page
+        """
+        title = f"<title>{title}</title>".replace(PATH_PLACEHOLDER, main_path)
+        body = body.replace(PATH_PLACEHOLDER, main_path)
+        for i, part in enumerate(self.fill_path(main_path)):
+            if i:
+                out_file.write(title)
+            for j, piece in enumerate(part):
+                if j:
+                    out_file.write(body)
+                out_file.write(piece)
 
 
 def extract_meta(line):
@@ -67,87 +158,117 @@ def extract_meta(line):
         raise Exception("Data invalid or non-existant")
 
 
-def remove_unsafe_chars(string):
+def remove_unsafe_chars(text):
     """Remove URL-unsafe characters
 
     Args:
-        string (String): to be sanitized
+        text (String): to be sanitized
 
     Returns:
         given string without any URL-unsafe characters (and spaces replaced
         with dashes)
     """
-    pattern = re.compile("[a-zA-Z0-9-_.+!*'()]")
-    fixed = ""
-    for c in string:
-        if pattern.search(c):
-            fixed += c
-        elif c == ' ':
-            fixed += '-'
-    return fixed.lower()
+    ascii_text = text.encode('ascii', 'ignore').decode('ascii')
+    return ascii_text.translate(URL_TRANSLATION).lower()
 
 
-def add_post(fpath, in_path, posts_list, tags_dict):
-    """Create Post (and any necessary Tags) and add them to tracking lists
+def parse_post(fpath):
+    """Read a raw post file and render it into a Post
+
+    Touches no shared state, so posts can be parsed in worker processes.
 
     Args:
         fpath (String): path to raw post file (should be .md)
-        posts_list (List): possibly-empty list of Posts; will be modified
-        tags_dict (Dictionary): key is tag name, value is Tag object
 
-    returns:
-        created Post object. Also modifies posts_list and tags_dict to contain
-        any newly created objects where needed
+    Returns:
+        created Post object
     """
     print(f"reading post from {fpath}")
-    infile = open(fpath)
+    # four meta lines, then the body
+    lines = pathlib.Path(fpath).read_text(encoding="utf-8").split('\n', 4)
+    if len(lines) < 5:
+        raise Exception(f"Missing post meta in {fpath}")
 
     # get meta
-    title = extract_meta(infile.readline())
+    title, tags, date, preview = [extract_meta(line + '\n')
+                                  for line in lines[:4]]
     url = remove_unsafe_chars(title[:MAX_URL_LEN])
     while not url[-1].isalnum() and len(url) > 1:
         url = url[:-1]
-    tags = extract_meta(infile.readline()).split(',')
-    tags = [remove_unsafe_chars(tag) for tag in tags]
-    date = datetime.datetime.strptime(extract_meta(infile.readline()),"%Y/%m/%d")
-    preview = extract_meta(infile.readline())
+    tags = [remove_unsafe_chars(tag) for tag in tags.split(',')]
+    date = datetime.datetime.strptime(date, "%Y/%m/%d")
 
     # get body
-    body = mistune.markdown(infile.read())
-    infile.close()
+    body = MARKDOWN(lines[4])
 
     # clean up newlines
-    while body[0] == '\n':
-        body = body[1:]
-    while body[-1] == '\n':
-        body = body[:-1]
+    body = body.strip('\n')
 
-    # add post header + surrounding body
     # process any custom annotations
-    tag_link_html = ""
-    for tag in tags:
-        tag_link_html += (f'<li><a href="../../tag/{tag}.html">#{tag}</a></li>')
-    title_card = open(os.path.join(in_path, "theme/post_title_card.html")).read()
-    title_card = title_card.replace("<!--title-->", title)
-    title_card = title_card.replace("<!--date-->", f"{date.strftime('%B')} {date.day} {date.year}")
-    title_card = title_card.replace("<!--tags-->", tag_link_html)
-    body = title_card + '<div><div class="card-body">' + body + '</div></div>'
     body = body.replace("<p><strong><em>sm-table</em></strong></p>\n<table>",
                         '<table class="table table-sm">')
     body = body.replace("<p><strong><em>blockquote</em></strong></p>", '<blockquote class="blockquote">')
     body = body.replace('<p><strong><em>end-blockquote</em></strong></p>', '</blockquote>')
-    # generate objects
-    post = Post(title, date, tags, preview, body)
+    return Post(title, date, tags, preview, body, url)
+
+
+def register_post(post, posts_list, tags_dict):
+    """Add a Post (and any necessary Tags) to tracking lists
+
+    Args:
+        post (Post): parsed post
+        posts_list (List): possibly-empty list of Posts; will be modified
+        tags_dict (Dictionary): key is tag name, value is Tag object
+    """
     posts_list.append(post)
-    for tag in tags:
-        if tag in tags_dict.keys():
-            tags_dict[tag].members.append(post)
-        else:
+    for tag in post.tags:
+        tag_obj = tags_dict.get(tag)
+        if tag_obj is None:
             tags_dict[tag] = Tag(tag, [post])
+        else:
+            tag_obj.members.append(post)
+
+
+def add_post(fpath, posts_list, tags_dict):
+    """Create Post (and any necessary Tags) and add them to tracking lists
+
+    Args:
+        fpath (String): path to raw post file (should be .md)
+        posts_list (List): possibly-empty list of Posts; will be modified
+        tags_dict (Dictionary): key is tag name, value is Tag object
+
+    returns:
+        created Post object. Also modifies posts_list and tags_dict to contain
+        any newly created objects where needed
+    """
+    post = parse_post(fpath)
+    register_post(post, posts_list, tags_dict)
     print(f"Added post from {fpath}")
     return post
 
 
+def split_at_line(text, marker):
+    """Split text around the line containing a marker
+
+    Args:
+        text (String): text to split
+        marker (String): substring identifying the line to split on
+
+    Returns:
+        tuple of Strings: (text before the marker's line, the marker's line,
+        text after the marker's line)
+
+    Raises:
+        Exception: marker not present in text
+    """
+    marker_index = text.find(marker)
+    if marker_index == -1:
+        raise Exception(f"Template is missing {marker}")
+    line_start = text.rfind('\n', 0, marker_index) + 1
+    line_end = text.find('\n', marker_index) + 1 or len(text)
+    return text[:line_start], text[line_start:line_end], text[line_end:]
+
+
 def make_header(posts, in_path):
     """
     Make page header with correct links and appropriate relative paths
@@ -160,29 +281,18 @@ def make_header(posts, in_path):
         complete HTML for header, as a String
     TODO: more hardcoding of list border tags
     """
-    listings = defaultdict(set)
-    header_html = ""
-    for post in posts:
-        listings[post.date.year].add(post.date.strftime("%B"))
-    header_template_html = open(os.path.join(in_path, "theme/header_template.html"))
-    start_pattern = re.compile("<!--monthlist-->")
-    line = header_template_html.readline()
-    while not start_pattern.search(line):
-        header_html += line
-        line = header_template_html.readline()
-    header_html += line
-    months = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
-              'August', 'September', 'October', 'November', 'December']
-    for year in sorted(listings.keys(), reverse=True):
-        for month in months[::-1]:
-            if month in listings[year]:
-                header_html += f'<a class="dropdown-item" href="<!--main_path-->blog/{year}/{month}.html">{month} {year}</a>\n'
-    header_template_html.readline()
-    while line:
-        header_html += line
-        line = header_template_html.readline()
+    # (year, month number, month name) for every month with a post
+    listings = sorted({(post.date.year, post.date.month, post.month_name)
+                       for post in posts}, reverse=True)
+    with open(os.path.join(in_path, "theme/header_template.html")) as infile:
+        header_html, monthlist_line, rest = split_at_line(infile.read(),
+                                                          "<!--monthlist-->")
+    month_links = [
+        f'<a class="dropdown-item" href="<!--main_path-->blog/{year}/{month}.html">{month} {year}</a>\n'
+        for year, _, month in listings
+    ]
     print("Header generation successful")
-    return header_html
+    return header_html + monthlist_line + "".join(month_links) + rest
 
 
 def make_template(input_dir, header_html):
@@ -198,195 +308,155 @@ def make_template(input_dir, header_html):
     Returns:
         a String containing the full HTML template for all pages
     """
-    t_file = open(os.path.join(input_dir,
-                               'theme/body_template.html'), 'r')
-    template_html = ""
-    pattern = re.compile("<!--navbar-->")
-    line = t_file.readline()
-    while not pattern.search(line):
-        template_html += line
-        line = t_file.readline()
-    template_html += header_html
-    t_file.readline()
-    line = t_file.readline()
-    while line:
-        template_html += line
-        line = t_file.readline()
+    with open(os.path.join(input_dir, 'theme/body_template.html')) as infile:
+        before, _, after = split_at_line(infile.read(), "<!--navbar-->")
+    # header_html brings its own navbar markers, so drop the closing one too
+    after = after.partition('\n')[2]
     print("Template generation successful")
-    return template_html
+    return before + header_html + after
 
 
-def make_post(post, template, output_dir):
+def make_post(post, template, input_dir, output_dir):
     """Assemble individual post HTML and write to output directory.
 
     Args:
         post (Post): Post object to generate page for
-        template (String): page HTML body template
-        output_dir (String): path to output directory
+        template (PageTemplate): page HTML body template
+        input_dir (String): path to provided input directory
+        output_dir (String): path to output directory. The post's
+            blog/<year>/<month> subdirectory must already exist.
 
     Returns:
-        HTML for generated post page
-        Also writes post to corresponding directory under output_dir
+        Nothing, but writes post to corresponding directory under output_dir
     """
-    post_html = template[:]
-    post_html = post_html.replace("<title>template</title>",
-                                  f"<title>{post.title}</title>")
-    post_html = post_html.replace("<!--main page-->\n    <!--/main page-->",
-                                  post.body)
-    post_html = post_html.replace("<!--main_path-->","../../../")
-    post_html = post_html.replace('<img src="../resources/',
+    # add post header + surrounding body
+    tag_link_html = "".join(f'<li><a href="../../tag/{tag}.html">#{tag}</a></li>'
+                            for tag in post.tags)
+    title_card = pathlib.Path(input_dir, "theme/post_title_card.html").read_text()
+    title_card = title_card.replace("<!--title-->", post.title)
+    title_card = title_card.replace("<!--date-->", f"{post.month_name} {post.date.day} {post.year_str}")
+    title_card = title_card.replace("<!--tags-->", tag_link_html)
+    body = title_card + '<div><div class="card-body">' + post.body + '</div></div>'
+    body = body.replace('<img src="../resources/',
             '<img class="img-fluid img-thumbnail rounded mx-auto d-block" ' +
             'style="max-width: 85%" src="../../resources/')
-    out_path = os.path.join(output_dir, "blog")
-    pathlib.Path(out_path).mkdir(exist_ok=True)
-    out_path = os.path.join(out_path, str(post.date.year))
-    pathlib.Path(out_path).mkdir(exist_ok=True)
-    out_path = os.path.join(out_path, post.date.strftime("%B"))
-    pathlib.Path(out_path).mkdir(exist_ok=True)
-    out_path = os.path.join(out_path,
-            f"{remove_unsafe_chars(post.title[:MAX_URL_LEN])}.html")
-    out_file = open(out_path, "w")
-    out_file.write(post_html)
-    out_file.close()
+    out_path = os.path.join(output_dir, "blog", post.year_str,
+            post.month_name, f"{post.url}.html")
+    with open(out_path, "w", buffering=WRITE_BUFFER_SIZE) as out_file:
+        template.write(out_file, post.title, body, "../../../")
     print(f"Successfully wrote post: {post.title}")
-    return post_html
 
 
-def make_card(post, input_dir):
+def make_card(post, card_template):
     """Generate HTML for post card in post index pages
 
+    A post's card shows up on several index pages, so it is rendered once
+    and cached on the post; a post is only ever shown with one card template.
+
     Args:
         post (Post): Post object to make card for
+        card_template (String): HTML of the theme's card template
 
     Returns:
         HTML for generated card
     """
-    card_template_file = open(os.path.join(input_dir, "theme/card_template.html"))
-    card_html = card_template_file.read()
-    card_template_file.close()
-    url = f"blog/{str(post.date.year)}/{post.date.strftime('%B')}/{remove_unsafe_chars(post.title[:MAX_URL_LEN])}.html"
-    card_html = card_html.replace("<!--post_url-->", url)
+    if post.card_html is not None:
+        return post.card_html
+    url = f"blog/{post.year_str}/{post.month_name}/{post.url}.html"
+    card_html = card_template.replace("<!--post_url-->", url)
     card_html = card_html.replace("<!--title-->", post.title)
-    card_html = card_html.replace("<!--date-->", post.date.strftime("%B %d %Y"))
+    card_html = card_html.replace("<!--date-->", post.date_display)
     card_html = card_html.replace("<!--preview-->", post.preview)
+    post.card_html = card_html
     return card_html
 
 
-def make_tag(tag, template, input_dir, output_dir):
+def make_tag(tag, template, card_template, input_dir, output_dir):
     """Generate page for tag
 
     Args:
-        tag (Tag): tag to make page for
-        template (String): HTML (header/body) template
-        output_dir (String): path to output directory
+        tag (Tag): tag to make page for, with members newest first
+        template (PageTemplate): HTML (header/body) template
+        card_template (String): HTML of the theme's card template
+        input_dir (String): path to provided input directory
+        output_dir (String): path to output directory. Its blog/tag
+            subdirectory must already exist.
 
     Returns:
-        HTML for generated tag page
-        Also saves tag page to corresponding directory under output_dir
+        Nothing, but saves tag page to corresponding directory under output_dir
     """
-    tag.members.sort(key=lambda x: x.date, reverse=True)
-    post_cards = ""
-    for post in tag.members:
-        post_cards += make_card(post, input_dir)
-    page_html = template[:]
-    page_html = page_html.replace("<title>template</title>",
-                                  f"<title>Tag: {tag.name}</title>")
-    title_card = open(os.path.join(input_dir, "theme/post_list_title_card.html")).read()
+    post_cards = "".join(make_card(post, card_template) for post in tag.members)
+    title_card = pathlib.Path(input_dir,
+                              "theme/post_list_title_card.html").read_text()
     title_card = title_card.replace("<!--title-->", f"Posts: #{tag.name}")
     post_cards = title_card + post_cards
-    page_html = page_html.replace("<!--main page-->\n    <!--/main page-->",
-                                  post_cards)
-    page_html = page_html.replace("<!--main_path-->", "../../")
-    out_path = os.path.join(output_dir, "blog")
-    pathlib.Path(out_path).mkdir(exist_ok=True)
-    out_path = os.path.join(out_path, "tag")
-    pathlib.Path(out_path).mkdir(exist_ok=True)
-    out_path = os.path.join(out_path, f"{tag.name}.html")
-    out_file = open(out_path, "w")
-    out_file.write(page_html)
-    out_file.close()
+    out_path = os.path.join(output_dir, "blog", "tag", f"{tag.name}.html")
+    with open(out_path, "w", buffering=WRITE_BUFFER_SIZE) as out_file:
+        template.write(out_file, f"Tag: {tag.name}", post_cards, "../../")
     print(f"Successfully created page for tag: {tag.name}")
-    return page_html
 
 
-def make_month(month, posts, template_html, input_dir, output_dir):
+def make_month(month, posts, template_html, card_template, input_dir,
+               output_dir):
     """Generate index page for a given month/year
 
     Args:
         month (Tuple): pair of Strings indicating (month, year)
-        posts (List): of Post objects
-        template_html (String): template HTML to fill in (page header/etc)
-        output_dir (String): path to output directory
+        posts (List): of Post objects, newest first
+        template_html (PageTemplate): template HTML to fill in (page header/etc)
+        card_template (String): HTML of the theme's card template
+        input_dir (String): path to provided input directory
+        output_dir (String): path to output directory. Its blog/<year>
+            subdirectory must already exist.
 
     Returns:
-        HTML for generated month page
-        Also writes month page to corresponding directory under output_dir
+        Nothing, but writes month page to corresponding directory under
+        output_dir
     """
-    posts.sort(key=lambda x: x.date, reverse=True)
-    post_cards = ""
-    for post in posts:
-        post_cards += make_card(post, input_dir)
-    title_card = open(os.path.join(input_dir, "theme/post_list_title_card.html")).read()
+    post_cards = "".join(make_card(post, card_template) for post in posts)
+    title_card = pathlib.Path(input_dir,
+                              "theme/post_list_title_card.html").read_text()
     title_card = title_card.replace("<!--title-->", f"Posts: {month[0]} {month[1]}")
     post_cards = title_card + post_cards
-    page_html = template_html[:]
-    page_html = page_html.replace("<title>template</title>",
-                                  f"<title>{month[0]} {month[1]}</title>")
-    page_html = page_html.replace("<!--main page-->\n    <!--/main page-->",
-                                  post_cards)
-    page_html = page_html.replace("<!--main_path-->", "../../")
-    out_path = os.path.join(output_dir, "blog")
-    pathlib.Path(out_path).mkdir(exist_ok=True)
-    out_path = os.path.join(out_path, month[1])
-    pathlib.Path(out_path).mkdir(exist_ok=True)
-    out_path = os.path.join(out_path, f"{month[0]}.html")
-    out_file = open(out_path, "w")
-    out_file.write(page_html)
-    out_file.close()
+    out_path = os.path.join(output_dir, "blog", month[1], f"{month[0]}.html")
+    with open(out_path, "w", buffering=WRITE_BUFFER_SIZE) as out_file:
+        template_html.write(out_file, f"{month[0]} {month[1]}", post_cards,
+                            "../../")
     print(f"Successfully created page for month: {month[0]} {month[1]}")
-    return page_html
 
 
-def make_recent(posts, template_html, input_dir, output_dir):
+def make_recent(posts, template_html, card_template, input_dir, output_dir):
     """Generate page for Recent Posts
 
     Args:
-        posts_list (List): List of all Post objects
-        template_html (String): string containing page template html
-        output_dir (String): string containing path to output directory
+        posts (List): List of all Post objects, newest first
+        template_html (PageTemplate): page template
+        card_template (String): HTML of the theme's card template
+        input_dir (String): path to provided input directory
+        output_dir (String): string containing path to output directory. Its
+            blog subdirectory must already exist.
 
     Returns:
-        HTML for generated Recent page
-        Also writes Recent page under corresponding directory in output_dir
+        Nothing, but writes Recent page under corresponding directory in
+        output_dir
     """
-    posts.sort(key=lambda x: x.date, reverse=True)
-    post_cards = ""
-    for post in posts[:10]:
-        post_cards += make_card(post, input_dir)
-    title_card = open(os.path.join(input_dir, "theme/post_list_title_card.html")).read()
+    post_cards = "".join(make_card(post, card_template)
+                         for post in posts[:10])
+    title_card = pathlib.Path(input_dir,
+                              "theme/post_list_title_card.html").read_text()
     title_card = title_card.replace("<!--title-->", f"Recent Posts")
     post_cards = title_card + post_cards
-    page_html = template_html[:]
-    page_html = page_html.replace("<title>template</title>",
-                                  "<title>recent posts</title>")
-    page_html = page_html.replace("<!--main page-->\n    <!--/main page-->",
-                                  post_cards)
-    page_html = page_html.replace("<!--main_path-->", "../")
-    out_path = os.path.join(output_dir, "blog")
-    pathlib.Path(out_path).mkdir(exist_ok=True)
-    out_path = os.path.join(out_path, "recent.html")
-    out_file = open(out_path, "w")
-    out_file.write(page_html)
-    out_file.close()
+    out_path = os.path.join(output_dir, "blog", "recent.html")
+    with open(out_path, "w", buffering=WRITE_BUFFER_SIZE) as out_file:
+        template_html.write(out_file, "recent posts", post_cards, "../")
     print("Successfully generated page for recent posts")
-    return page_html
 
 
 def make_static_pages(template_html, input_dir, output_dir):
     """Generate core site pages
 
     Args:
-        template_html (String): string containing page template html
+        template_html (PageTemplate): page template
         input_dir (string): string containing path to input directory.
              *** Should include static page directory, including
              pages like projects.
@@ -395,26 +465,33 @@ def make_static_pages(template_html, input_dir, output_dir):
     Returns:
         Nothing, but writes HTML to files under output_dir
     """
-    template_html = template_html.replace("<!--main_path-->", "")
     static_dir = os.path.join(input_dir, "static-pages");
     for page in os.listdir(static_dir):
         page_name = os.path.splitext(page)[0]
         if page_name == "index":
             page_name = "james stevenson"
         with open(os.path.join(static_dir, page), "r") as infile:
-            html = (template_html[:]
-                    .replace("<title>template</title>",
-                                 f"<title>{page_name}</title>")
-                    .replace("<!--main page-->\n    <!--/main page-->",
-                                 infile.read()))
             outpath = os.path.join(output_dir, page)
-            with open(outpath, "w") as outfile:
-                outfile.write(html)
+            with open(outpath, "w", buffering=WRITE_BUFFER_SIZE) as outfile:
+                template_html.write(outfile, page_name, infile.read(), "")
 
     print("Successfully generated core pages")
     return
 
 
+def get_chunksize(num_items):
+    """Pick how many posts each worker process parses per task
+
+    Args:
+        num_items (int): number of posts to be parsed
+
+    Returns:
+        chunk size handing each worker roughly four batches, so that
+        uneven posts still balance out without paying IPC costs per post
+    """
+    return max(1, num_items // (4 * (os.cpu_count() or 1)))
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('in_path', metavar='in_path', type=str,
@@ -432,41 +509,60 @@ def main():
 
     # open blog posts directory, read each post into internal listings
     posts_path = os.path.join(input_dir, "posts")
-    for entry in os.listdir(posts_path):
-        post_path = os.path.join(posts_path, entry)
-        if os.path.isfile(post_path):
-            add_post(post_path, input_dir, posts_list, tags_dict)
+    with os.scandir(posts_path) as entries:
+        post_paths = [entry.path for entry in entries if entry.is_file()]
+    # rendering markdown dominates build time and each post is independent,
+    # so parse across cores and only register the results here
+    with ProcessPoolExecutor() as executor:
+        parsed_posts = list(executor.map(
+            parse_post, post_paths, chunksize=get_chunksize(len(post_paths))))
+    # sort once, newest first, before registering; posts_list, tag members,
+    # month groups and the recent page all keep that order
+    parsed_posts.sort(key=operator.attrgetter("date"), reverse=True)
+    for post in parsed_posts:
+        register_post(post, posts_list, tags_dict)
 
     # generate template
     header_html = make_header(posts_list, input_dir)
     template_html = make_template(input_dir, header_html)
+    page_template = PageTemplate(template_html)
 
     # generate pages from template
     pathlib.Path(output_dir).mkdir(exist_ok=True)
     pathlib.Path(os.path.join(output_dir, "css")).mkdir(exist_ok=True)
     shutil.copy(os.path.join(input_dir, "theme/custom.css"),
                 os.path.join(output_dir, "css/"))
+    months = {m_y: list(month_posts) for m_y, month_posts in itertools.groupby(
+        posts_list, key=operator.attrgetter("month_name", "year_str"))}
+    card_template = pathlib.Path(input_dir,
+                                 "theme/card_template.html").read_text()
+    # create every output directory up front, rather than once per page
+    pathlib.Path(output_dir, "blog", "tag").mkdir(parents=True, exist_ok=True)
+    for month, year in months:
+        pathlib.Path(output_dir, "blog", year, month).mkdir(parents=True,
+                                                            exist_ok=True)
     for post in posts_list:
-        make_post(post, template_html, output_dir)
+        make_post(post, page_template, input_dir, output_dir)
     for tag in tags_dict.values():
-        make_tag(tag, template_html, input_dir, output_dir)
-    months = defaultdict(list)
-    for post in posts_list:
-        m_y = (post.date.strftime("%B"), str(post.date.year))
-        months[m_y].append(post)
-    for month in months.keys():
-        make_month(month, months[month], template_html, input_dir, output_dir)
-    make_recent(posts_list, template_html, input_dir, output_dir)
-    make_static_pages(template_html, input_dir, output_dir)
+        make_tag(tag, page_template, card_template, input_dir, output_dir)
+    for month, month_posts in months.items():
+        make_month(month, month_posts, page_template, card_template, input_dir,
+                   output_dir)
+    make_recent(posts_list, page_template, card_template, input_dir,
+                output_dir)
+    make_static_pages(page_template, input_dir, output_dir)
 
     # copy images from resources dir
     resources_out_path = os.path.join(output_dir, "blog/resources")
     pathlib.Path(resources_out_path).mkdir(exist_ok=True)
     resources_path = os.path.join(input_dir, "resources")
-    for entry in os.listdir(resources_path):
-        resource_path = os.path.join(resources_path, entry)
-        if os.path.isfile(resource_path):
-            shutil.copy(resource_path, os.path.join(resources_out_path, entry))
+    with os.scandir(resources_path) as entries:
+        resources = [entry for entry in entries if entry.is_file()]
+    # copying is I/O bound and releases the GIL, so threads are enough here
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(lambda entry: shutil.copy(
+            entry.path, os.path.join(resources_out_path, entry.name)),
+            resources))
 
 
 if __name__ == '__main__':
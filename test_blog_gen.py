@@ -1,6 +1,7 @@
-import blog_generate as bg
+import bssg as bg
 import pytest
 import datetime as dt
+import io
 
 def test_extract_meta():
     line = "# meta-info\n"
@@ -17,6 +18,19 @@ def test_remove_unsafe_chars():
     assert bg.remove_unsafe_chars(title2) == "a-string-with-spaces"
     title3 = "Lotta $$ unsafe [] % chars # here"
     assert bg.remove_unsafe_chars(title3) == "lotta--unsafe---chars--here"
+    title4 = "Café Über"
+    assert bg.remove_unsafe_chars(title4) == "caf-ber"
+
+
+def test_default_lists_not_shared():
+    tag1 = bg.Tag("first")
+    tag2 = bg.Tag("second")
+    tag1.members.append("post")
+    assert tag2.members == []
+    post1 = bg.Post("first", dt.datetime(2020, 5, 8))
+    post2 = bg.Post("second", dt.datetime(2020, 5, 8))
+    post1.tags.append("tag")
+    assert post2.tags == []
 
 
 def test_add_post():
@@ -67,3 +81,88 @@ def test_add_post():
     <h2>This is the first line in the doc.</h2>\n<p>Lorem ipsum. <em>Italic text.</em> Lorem ipsum. <strong>Bold text.</strong></p>\n<h2>header 2</h2>\n<p>Unordered list.</p>\n<ul>\n<li>Item 1.</li>\n<li>Item 2. Taking lots of lines. Long text. Long text. Long text. Long text. Long text. Long text. Long text. Long text. Long text. Long text. Long text. Long text. Long text. Long text. Long text. Long text. Long text. Long text. Long text. Long text. Long text. Long text. Long text.</li>\n<li>Item 3.</li>\n</ul>\n<h2>header 2</h2>\n<p><code>code\ncode code code\ncode</code></p>\n<hr>\n<h2>header 2</h2>'
     """
     # assert post.body == body
+
+
+def test_make_header(tmp_path):
+    theme_path = tmp_path / "theme"
+    theme_path.mkdir()
+    (theme_path / "header_template.html").write_text(
+        "<nav>\n    <!--monthlist-->\n    <!--/monthlist-->\n</nav>\n")
+    posts = [bg.Post("a", dt.datetime(2020, 5, 8)),
+             bg.Post("b", dt.datetime(2021, 1, 3)),
+             bg.Post("c", dt.datetime(2020, 5, 20)),
+             bg.Post("d", dt.datetime(2020, 9, 14))]
+    link = '<a class="dropdown-item" href="<!--main_path-->blog/{1}/{0}.html">{0} {1}</a>\n'
+    assert bg.make_header(posts, str(tmp_path)) == (
+        "<nav>\n    <!--monthlist-->\n"
+        + link.format("January", 2021)
+        + link.format("September", 2020)
+        + link.format("May", 2020)
+        + "    <!--/monthlist-->\n</nav>\n")
+
+
+def test_make_month(tmp_path):
+    theme_path = tmp_path / "theme"
+    theme_path.mkdir()
+    (theme_path / "post_list_title_card.html").write_text("<h1><!--title--></h1>")
+    (tmp_path / "out" / "blog" / "2020").mkdir(parents=True)
+    card_template = '<a href="<!--main_path--><!--post_url-->"><!--title--></a>'
+    template = bg.PageTemplate(
+        "<title>template</title><!--main page-->\n    <!--/main page-->")
+    posts = [bg.Post("Second", dt.datetime(2020, 5, 20), url="second"),
+             bg.Post("First", dt.datetime(2020, 5, 8), url="first")]
+    bg.make_month(("May", "2020"), posts, template, card_template,
+                  str(tmp_path), str(tmp_path / "out"))
+    page = (tmp_path / "out" / "blog" / "2020" / "May.html").read_text()
+    assert page == ('<title>May 2020</title><h1>Posts: May 2020</h1>'
+                    '<a href="../../blog/2020/May/second.html">Second</a>'
+                    '<a href="../../blog/2020/May/first.html">First</a>')
+
+
+def test_page_template_write():
+    body_placeholder = "<!--main page-->\n    <!--/main page-->"
+    # repeated title and body placeholders are all filled in
+    template = bg.PageTemplate("<title>template</title>|" + body_placeholder
+                               + "|<title>template</title>|" + body_placeholder)
+    out_file = io.StringIO()
+    template.write(out_file, "Title", "<p>body</p>", "")
+    assert out_file.getvalue() == ("<title>Title</title>|<p>body</p>|"
+                                   "<title>Title</title>|<p>body</p>")
+
+    # main_path is substituted in the template, the title and the body
+    template = bg.PageTemplate('<a href="<!--main_path-->index.html"></a>'
+                               "<title>template</title>" + body_placeholder)
+    out_file = io.StringIO()
+    template.write(out_file, "<!--main_path-->title",
+                   '<img src="<!--main_path-->img.png">', "../../")
+    assert out_file.getvalue() == ('<a href="../../index.html"></a>'
+                                   "<title>../../title</title>"
+                                   '<img src="../../img.png">')
+
+
+def test_page_template_fill_path():
+    template = bg.PageTemplate("<!--main_path-->a<title>template</title>b")
+    pieces = template.fill_path("../")
+    assert pieces == [["../a"], ["b"]]
+    assert template.fill_path("../") is pieces
+    assert template.fill_path("") == [["a"], ["b"]]
+    assert template.pieces == [["<!--main_path-->a"], ["b"]]
+
+
+def test_split_at_line():
+    assert bg.split_at_line("<!--navbar-->\nrest\n", "<!--navbar-->") == (
+        "", "<!--navbar-->\n", "rest\n")
+    assert bg.split_at_line("start\n  <!--navbar-->", "<!--navbar-->") == (
+        "start\n", "  <!--navbar-->", "")
+    with pytest.raises(Exception):
+        bg.split_at_line("start\nend\n", "<!--navbar-->")
+
+
+def test_make_template(tmp_path):
+    theme_path = tmp_path / "theme"
+    theme_path.mkdir()
+    (theme_path / "body_template.html").write_text(
+        "<body>\n    <!--navbar-->\n    <!--/navbar-->\n</body>\n")
+    header_html = "<!--navbar-->\n<nav></nav>\n<!--/navbar-->\n"
+    assert bg.make_template(str(tmp_path), header_html) == (
+        "<body>\n" + header_html + "</body>\n")